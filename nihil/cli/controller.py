@@ -4,8 +4,10 @@
 
 import os
 import secrets
+import shlex
 import sys
 import time
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional
 
@@ -17,76 +19,105 @@ from nihil.features.browser_ui import (
     get_session_str_for_recap as browser_ui_get_session_str,
     is_page_ready as browser_ui_is_page_ready,
 )
-from nihil.manager import NihilManager
-from nihil.cli.parser import create_parser
+from nihil.cli.parser import create_parser, sniff_subcommand
 from nihil.console import NihilFormatter, print_compact_banner
 from nihil.exceptions import NihilError
-from nihil.utils import NihilDoctor, log_command
+from nihil.utils import log_command
 from nihil import __version__
 
 
 class NihilController:
+    # Option --network -> network_mode Docker
+    _NETWORK_MODES = {"host": "host", "disabled": "none", "docker": "bridge", "nat": "bridge"}
+    _VARIANT_DESCRIPTIONS = {
+        "full": "The whole flock, every tool, every module",
+        "ad": "Nest in their Active Directory",
+        "web": "Beak through their web apps",
+        "blueteam": "Blue Team, DFIR and threat hunting",
+    }
+
     def __init__(self):
         ensure_filesystem()
-        self.config = NihilConfig()
-        self.parser = create_parser()
+        # sous-commande visée (None = arbre complet) -> parser construit
+        self._parsers = {}
         self.manager = None
-        self.formatter = NihilFormatter()
+        # commande -> (handler, besoin d'un NihilManager connecté à Docker)
+        self._handlers = {
+            "version": (self._cmd_version, False),
+            "doctor": (self._cmd_doctor, False),
+            "config": (self._cmd_config, False),
+            "resources": (self._cmd_resources, False),
+            "info": (self._cmd_info, True),
+            "images": (self._cmd_images, True),
+            "start": (self._cmd_start, True),
+            "stop": (self._cmd_stop, True),
+            "remove": (self._cmd_remove, True),
+            "exec": (self._cmd_exec, True),
+            "update": (self._cmd_update, True),
+            "install": (self._cmd_install, True),
+            "uninstall": (self._cmd_uninstall, True),
+            "upgrade": (self._cmd_upgrade, True),
+            "tools": (self._cmd_tools, True),
+            "build": (self._cmd_build, True),
+            "completion": (self._cmd_completion, False),
+        }
+
+    @property
+    def parser(self):
+        if None not in self._parsers:
+            self._parsers[None] = create_parser()
+        return self._parsers[None]
+
+    @cached_property
+    def config(self) -> NihilConfig:
+        # Lu à la première utilisation : stop/remove/exec/info... n'ouvrent pas config.yml
+        return NihilConfig()
+
+    @cached_property
+    def formatter(self) -> NihilFormatter:
+        # Construit à la demande : --help / version n'ont pas besoin de la console rich
+        return NihilFormatter()
 
     def run(self, args: Optional[list] = None) -> int:
-        parsed_args = self.parser.parse_args(args)
+        # Ré-entrant : aucun état d'une invocation précédente ne doit fuir
+        self.manager = None
+        argv = sys.argv[1:] if args is None else args
+        key = sniff_subcommand(argv)
+        parser = self._parsers.get(key)
+        if parser is None:
+            # Ne construit que le sous-parser de la commande demandée
+            parser = self._parsers[key] = create_parser(argv)
+        parsed_args = parser.parse_args(args)
+        # Pas de bannière dans un pipe / une redirection : la sortie reste exploitable
         should_show_banner = (
             parsed_args.command is not None and
-            parsed_args.command not in ["version", "completion", "config"]
+            parsed_args.command not in ["version", "completion", "config"] and
+            sys.stdout.isatty()
         )
         if should_show_banner:
             print_compact_banner()
         if parsed_args.command is None:
-            self.parser.print_help()
+            parser.print_help()
             return 0
-        if parsed_args.command == "version":
-            print(f"Nihil version {__version__}")
-            return 0
-        if parsed_args.command == "doctor":
-            doctor = NihilDoctor(formatter=self.formatter)
-            return doctor.run()
-        if parsed_args.command == "config":
-            return self._cmd_config(parsed_args)
-        if parsed_args.command == "resources":
-            return self._cmd_resources(parsed_args)
-        try:
-            self.manager = NihilManager()
-        except NihilError as e:
-            print(self.formatter.error(str(e)), file=sys.stderr)
-            return e.exit_code
-        if parsed_args.command == "info":
-            return self._cmd_info(parsed_args)
-        elif parsed_args.command == "images":
-            return self._cmd_images()
-        elif parsed_args.command == "start":
-            return self._cmd_start(parsed_args)
-        elif parsed_args.command == "stop":
-            return self._cmd_stop(parsed_args)
-        elif parsed_args.command == "remove":
-            return self._cmd_remove(parsed_args)
-        elif parsed_args.command == "exec":
-            return self._cmd_exec(parsed_args)
-        elif parsed_args.command == "update":
-            return self._cmd_update(parsed_args)
-        elif parsed_args.command == "install":
-            return self._cmd_install(parsed_args)
-        elif parsed_args.command == "uninstall":
-            return self._cmd_uninstall(parsed_args)
-        elif parsed_args.command == "upgrade":
-            return self._cmd_upgrade(parsed_args)
-        elif parsed_args.command == "tools":
-            return self._cmd_tools(parsed_args)
-        elif parsed_args.command == "build":
-            return self._cmd_build(parsed_args)
-        elif parsed_args.command == "completion":
-            return self._cmd_completion(parsed_args)
+        handler, needs_manager = self._handlers[parsed_args.command]
+        if needs_manager:
+            # Import différé : le SDK docker (requests, urllib3, ...) ne sert qu'ici
+            from nihil.manager import NihilManager
+            try:
+                self.manager = NihilManager()
+            except NihilError as e:
+                print(self.formatter.error(str(e)), file=sys.stderr)
+                return e.exit_code
+        return handler(parsed_args)
+
+    def _cmd_version(self, args) -> int:
+        print(f"Nihil version {__version__}")
         return 0
 
+    def _cmd_doctor(self, args) -> int:
+        from nihil.utils.doctor import NihilDoctor
+        return NihilDoctor(formatter=self.formatter).run()
+
     def _cmd_start(self, args) -> int:
         _NOT_CHECKED = object()
         _update_cache = [_NOT_CHECKED]
@@ -151,7 +182,6 @@ class NihilController:
                 self._print_container_info(container, args, created=False, update_available=get_update(container))
         else:
             print(self.formatter.info(f"Container '{container_name}' doesn't exist. Creating..."))
-            network_map = {"host": "host", "disabled": "none", "docker": "bridge", "nat": "bridge"}
             image_arg = args.image
             if image_arg is None:
                 from rich.console import Console
@@ -225,7 +255,7 @@ class NihilController:
                 name=container_name,
                 image=image,
                 privileged=args.privileged,
-                network_mode=network_map.get(args.network, "host"),
+                network_mode=self._NETWORK_MODES.get(args.network, "host"),
                 workspace=workspace_path,
                 vpn=bool(vpn_path),
                 vpn_config_path=vpn_path,
@@ -451,6 +481,7 @@ class NihilController:
 
     def _cmd_remove(self, args) -> int:
         container_names = args.names
+        known = {}
         if not container_names:
             from rich.prompt import Prompt
             from rich.console import Console
@@ -459,31 +490,32 @@ class NihilController:
             if not nihil_containers:
                 print("No nihil containers found.")
                 return 0
+            # Lignes construites une seule fois ; image via le mémo du manager (partagé avec list_containers)
+            row_by_name = {}
+            for c in nihil_containers:
+                status = c.status.capitalize()
+                try:
+                    tags = self.manager.container_image(c).tags
+                    image_tag = tags[0] if tags else c.attrs['Config']['Image']
+                except Exception:
+                    image_tag = c.attrs.get('Config', {}).get('Image', '<deleted image>')
+                if "/" in image_tag:
+                    image_tag = image_tag.split("/")[-1]
+                config_str = "Standard"
+                if c.attrs.get("HostConfig", {}).get("Privileged"):
+                    config_str = "Privileged 💥"
+                row_by_name[c.name] = [c.name, status, image_tag, config_str]
             selected_containers = []
-            while True:
-                available_containers = [c for c in nihil_containers if c.name not in selected_containers]
-                if not available_containers:
-                    break
-                rows = []
-                for c in available_containers:
-                    status = c.status.capitalize()
-                    try:
-                        image_tag = c.image.tags[0] if c.image.tags else c.attrs['Config']['Image']
-                    except Exception:
-                        image_tag = c.attrs.get('Config', {}).get('Image', '<deleted image>')
-                    if "/" in image_tag:
-                        image_tag = image_tag.split("/")[-1]
-                    config_str = "Standard"
-                    if c.attrs.get("HostConfig", {}).get("Privileged"):
-                        config_str = "Privileged 💥"
-                    rows.append([c.name, status, image_tag, config_str])
+            available_containers = list(nihil_containers)
+            while available_containers:
                 print("\n👽 Available containers")
-                self.formatter.print_table(["NAME", "STATUS", "IMAGE", "CONFIG"], rows)
+                self.formatter.print_table(["NAME", "STATUS", "IMAGE", "CONFIG"], [row_by_name[c.name] for c in available_containers])
                 default_choice = available_containers[0].name
                 try:
                     choice = Prompt.ask("[?] Select a container by its name", choices=[c.name for c in available_containers], default=default_choice)
                     selected_containers.append(choice)
-                    if not [c for c in available_containers if c.name != choice]:
+                    available_containers = [c for c in available_containers if c.name != choice]
+                    if not available_containers:
                         break
                     more = Prompt.ask("[?] Do you want to select another container?", choices=["y", "n"], default="n")
                     if more.lower() != 'y':
@@ -495,22 +527,77 @@ class NihilController:
                 print("No container selected.")
                 return 0
             container_names = selected_containers
+            # Conteneurs déjà récupérés pour la sélection : pas de nouvel aller-retour Docker par nom
+            known = {c.name: c for c in nihil_containers}
         errors = 0
+        targets = []
         for container_name in container_names:
-            container = self.manager.get_container(container_name)
+            container = known.get(container_name) or self.manager.get_container(container_name)
             if not container:
                 print(self.formatter.error(f"Container '{container_name}' doesn't exist."), file=sys.stderr)
                 errors += 1
                 continue
-            if container.status == "running":
-                print(self.formatter.info(f"Stopping container '{container_name}'..."))
-                self.manager.stop_container(container)
-            print(self.formatter.info(f"Removing container '{container_name}'..."))
-            self.manager.remove_container(container, force=args.force)
-            browser_ui_clear_password(container_name)
-            print(self.formatter.success(f"Container '{container_name}' removed successfully."))
+            targets.append((container_name, container))
+
+        removed = []
+
+        def remove(target, emit):
+            container_name, container = target
+            self._stop_and_remove(container, container_name, args.force, emit)
+            removed.append(container_name)
+
+        try:
+            errors += self._run_parallel(targets, remove)
+        finally:
+            # Même si une erreur non-NihilError (timeout Docker...) sort du pool
+            self._clear_browser_passwords(removed)
         return 1 if errors > 0 else 0
 
+    def _stop_and_remove(self, container, container_name: str, force: bool, emit=print) -> None:
+        """Arrête (si besoin) puis supprime un container déjà récupéré.
+
+        Le status lu au listing suffit : pas de reload() entre stop et remove, stop() ne rend la main
+        qu'une fois le container arrêté. Le mot de passe browser UI est effacé par l'appelant, hors du pool.
+        """
+        if container.status == "running":
+            emit(self.formatter.info(f"Stopping container '{container_name}'..."))
+            self.manager.stop_container(container)
+        emit(self.formatter.info(f"Removing container '{container_name}'..."))
+        self.manager.remove_container(container, force=force)
+        emit(self.formatter.success(f"Container '{container_name}' removed successfully."))
+
+    @staticmethod
+    def _clear_browser_passwords(container_names: list) -> None:
+        # Fichier partagé lu puis réécrit sans verrou : un seul thread, un container à la fois
+        for container_name in container_names:
+            browser_ui_clear_password(container_name)
+
+    def _run_parallel(self, items: list, action) -> int:
+        """Exécute action(item, emit) pour chaque item dans un pool de threads (appels Docker bloquants).
+
+        emit(message, file=None) affiche une ligne sous verrou. Renvoie le nombre d'items en échec (NihilError).
+        """
+        if not items:
+            return 0
+        import concurrent.futures
+        import threading
+        lock = threading.Lock()
+
+        def emit(message: str, file=None) -> None:
+            with lock:
+                print(message, file=file)
+
+        def task(item) -> bool:
+            try:
+                action(item, emit)
+                return True
+            except NihilError as e:
+                emit(self.formatter.error(str(e)), file=sys.stderr)
+                return False
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(10, len(items))) as executor:
+            return list(executor.map(task, items)).count(False)
+
     def _cmd_exec(self, args) -> int:
         container_name = args.name
         container = self.manager.get_container(container_name)
@@ -520,8 +607,11 @@ class NihilController:
         if container.status != "running":
             print(self.formatter.error(f"Container '{container_name}' is not running."), file=sys.stderr)
             return 1
-        command = " ".join(args.command) if args.command else "zsh"
-        self.manager.exec_in_container(container, command)
+        command = args.exec_command
+        if len(command) == 1:
+            # Une seule chaîne quotée ("nmap -sV host", lignes d'historique) : redécoupée comme un shell
+            command = shlex.split(command[0])
+        self.manager.exec_in_container(container, command or ["zsh"])
         return 0
 
     def _cmd_update(self, args) -> int:
@@ -853,6 +943,8 @@ class NihilController:
     def _cmd_uninstall(self, args) -> int:
         raw_images = args.names
         resolved_images = []
+        # Map each image ref to its local id so we can match containers robustly.
+        image_ids = {}
         if not raw_images:
             images_list = self.manager.list_images()
             if not images_list:
@@ -874,6 +966,8 @@ class NihilController:
                 choice = IntPrompt.ask("Select an image number", choices=[str(k) for k in range(1, len(images_list) + 1)], default=1)
                 selected_image = choices_map[choice - 1]
                 resolved_images.append(selected_image)
+                # L'id est déjà connu par le listing : pas de nouvel inspect
+                image_ids[selected_image] = images_list[choice - 1].id
             except (KeyboardInterrupt, EOFError):
                 print("\nAborted.")
                 return 0
@@ -888,9 +982,9 @@ class NihilController:
                 else:
                     resolved_images.append(item)
         images = resolved_images
-        # Map each image ref to its local id so we can match containers robustly.
-        image_ids = {}
         for image in images:
+            if image in image_ids:
+                continue
             try:
                 image_ids[image] = self.manager.client.images.get(image).id
             except Exception:
@@ -909,14 +1003,14 @@ class NihilController:
                 used_id = c.attrs.get("Image") or (c.image.id if c.image else None)
                 config_image = c.attrs.get("Config", {}).get("Image", "")
                 if used_id in target_ids or config_image in images:
-                    containers_to_remove.append(c.name)
+                    containers_to_remove.append(c)
             except Exception:
                 continue
         print(self.formatter.warning(f"Images to be removed: {', '.join(images)}"))
         if containers_to_remove:
             print(self.formatter.warning("The following containers are using these images:"))
-            for container_name in containers_to_remove:
-                print(f"  • {container_name}")
+            for container in containers_to_remove:
+                print(f"  • {container.name}")
             print()
             if args.force:
                 remove_containers = 'y'
@@ -928,18 +1022,21 @@ class NihilController:
                     remove_containers = 'n'
             if remove_containers.lower() in ['y', 'yes']:
                 print()
-                for container_name in containers_to_remove:
+                # Objets déjà obtenus par le listing : pas de get_container par nom
+                removed = []
+
+                def remove(container, emit):
+                    container_name = container.name
                     try:
-                        container = self.manager.get_container(container_name)
-                        if container:
-                            if container.status == "running":
-                                print(self.formatter.info(f"Stopping container '{container_name}'..."))
-                                self.manager.stop_container(container)
-                            print(self.formatter.info(f"Removing container '{container_name}'..."))
-                            self.manager.remove_container(container, force=True)
-                            print(self.formatter.success(f"Container '{container_name}' removed successfully."))
+                        self._stop_and_remove(container, container_name, True, emit)
+                        removed.append(container_name)
                     except Exception as e:
-                        print(self.formatter.error(f"Failed to remove container '{container_name}': {e}"), file=sys.stderr)
+                        emit(self.formatter.error(f"Failed to remove container '{container_name}': {e}"), file=sys.stderr)
+
+                try:
+                    self._run_parallel(containers_to_remove, remove)
+                finally:
+                    self._clear_browser_passwords(removed)
                 print()
             else:
                 print(self.formatter.error("Cannot remove images while containers are using them. Aborting."))
@@ -952,16 +1049,19 @@ class NihilController:
             if confirm.lower() not in ['y', 'yes']:
                 print("Aborted.")
                 return 0
-        errors = 0
-        for image in images:
-            print(self.formatter.info(f"Removing image '{image}'..."))
+        failed = []
+
+        def remove_image(image, emit):
+            emit(self.formatter.info(f"Removing image '{image}'..."))
             try:
                 self.manager.remove_image(image, force=args.force)
-                print(self.formatter.success(f"Image '{image}' removed successfully."))
+                emit(self.formatter.success(f"Image '{image}' removed successfully."))
             except Exception as e:
-                print(self.formatter.error(str(e)), file=sys.stderr)
-                errors += 1
-        return 1 if errors > 0 else 0
+                emit(self.formatter.error(str(e)), file=sys.stderr)
+                failed.append(image)
+
+        self._run_parallel(images, remove_image)
+        return 1 if failed else 0
 
     def _cmd_tools(self, args) -> int:
         from nihil.features.images import AVAILABLE_IMAGES
@@ -1002,33 +1102,35 @@ class NihilController:
         print(self.formatter.info(f"{total} tools available in {short_name}"))
         return 0
 
-    def _cmd_images(self) -> int:
+    def _cmd_images(self, args=None) -> int:
         print(self.formatter.section_header("AVAILABLE IMAGE VARIANTS"))
+        self._print_variants()
+        print()
+        print(self.formatter.info("Usage: nihil start <name> --image <variant>"))
+        return 0
+
+    def _print_variants(self) -> None:
+        """Tableau des variants (registry + builds locaux), partagé par images et info."""
         rows = []
-        variant_descriptions = {
-            "full": "The whole flock, every tool, every module",
-            "ad": "Nest in their Active Directory",
-            "web": "Beak through their web apps",
-            "blueteam": "Blue Team, DFIR and threat hunting",
-        }
-        local_v = self.manager.list_local_variants()
-        all_v = {**self.manager.AVAILABLE_IMAGES, **{k: v for k, v in local_v.items() if k not in self.manager.AVAILABLE_IMAGES}}
-        for variant, image_url in all_v.items():
-            description = variant_descriptions.get(variant, "Local build")
+        local_variants = self.manager.list_local_variants()
+        all_variants = {**self.manager.AVAILABLE_IMAGES, **{
+            k: v for k, v in local_variants.items() if k not in self.manager.AVAILABLE_IMAGES
+        }}
+        for variant, image_url in all_variants.items():
+            description = self._VARIANT_DESCRIPTIONS.get(variant, "Local build")
             info = self.manager.get_image_info(image_url)
             size_str = f"{info['size_bytes'] / (1024**3):.2f} GB" if info else "-"
             # AVAILABLE liste les :latest courants : pas besoin de @short_id de disambiguation
             version = self.manager.get_image_version(image_url) or "-"
             rows.append([variant, self.manager.short_image_name(image_url), version, size_str, description])
         self.formatter.print_table(["VARIANT", "IMAGE", "VERSION", "SIZE", "DESCRIPTION"], rows)
-        print()
-        print(self.formatter.info("Usage: nihil start <name> --image <variant>"))
-        return 0
 
     def _cmd_info(self, args) -> int:
         container_name = getattr(args, "container", None)
         if container_name:
-            self.manager = self.manager or NihilManager()
+            if self.manager is None:
+                from nihil.manager import NihilManager
+                self.manager = NihilManager()
             container = self.manager.get_container(container_name)
             if not container:
                 print(self.formatter.error(f"Container '{container_name}' doesn't exist."), file=sys.stderr)
@@ -1036,26 +1138,8 @@ class NihilController:
             self._print_container_info(container, args, created=False)
             return 0
         print(self.formatter.info(f"Nihil version {__version__}\n"))
-        variant_descriptions = {
-            "full": "The whole flock, every tool, every module",
-            "ad": "Nest in their Active Directory",
-            "web": "Beak through their web apps",
-            "blueteam": "Blue Team, DFIR and threat hunting",
-        }
         print(self.formatter.section_header("AVAILABLE IMAGE VARIANTS"))
-        rows = []
-        local_variants = self.manager.list_local_variants()
-        all_variants = {**self.manager.AVAILABLE_IMAGES, **{
-            k: v for k, v in local_variants.items() if k not in self.manager.AVAILABLE_IMAGES
-        }}
-        for variant, image_url in all_variants.items():
-            description = variant_descriptions.get(variant, "Local build")
-            info = self.manager.get_image_info(image_url)
-            size_str = f"{info['size_bytes'] / (1024**3):.2f} GB" if info else "-"
-            # AVAILABLE liste les :latest courants : pas besoin de @short_id de disambiguation
-            version = self.manager.get_image_version(image_url) or "-"
-            rows.append([variant, self.manager.short_image_name(image_url), version, size_str, description])
-        self.formatter.print_table(["VARIANT", "IMAGE", "VERSION", "SIZE", "DESCRIPTION"], rows)
+        self._print_variants()
         print()
         print(self.formatter.info("Use 'nihil start <name> --image <variant>' to create a container with a specific image."))
         print()
@@ -1095,8 +1179,10 @@ class NihilController:
                 else:
                     status = (f"{status_raw}", self.formatter.YELLOW)
                 try:
-                    image_raw = c.image.tags[0] if c.image.tags else c.attrs.get('Config', {}).get('Image', '<none>')
+                    image_obj = self.manager.container_image(c)
+                    image_raw = image_obj.tags[0] if image_obj.tags else c.attrs.get('Config', {}).get('Image', '<none>')
                 except Exception:
+                    image_obj = None
                     image_raw = c.attrs.get('Config', {}).get('Image', '<deleted image>')
                 if "/" in image_raw:
                     image = image_raw.split("/")[-1]
@@ -1109,7 +1195,7 @@ class NihilController:
                 except Exception:
                     is_current = None
                 try:
-                    container_version = self.manager.get_version_label(c, is_current)
+                    container_version = self.manager.get_version_label(image_obj or c, is_current)
                 except Exception:
                     container_version = None
                 if container_version:
@@ -1127,12 +1213,13 @@ class NihilController:
                 if isinstance(cell, tuple):
                     return len(str(cell[0]))
                 return len(str(cell))
-            name_width = max(len("NAME"), max(get_text_length(row[0]) for row in rows)) + 2
-            status_width = max(len("STATUS"), max(get_text_length(row[1]) for row in rows)) + 2
-            image_width = max(len("IMAGE"), max(get_text_length(row[2]) for row in rows)) + 2
-            update_width = max(len("UPDATE"), max(get_text_length(row[3]) for row in rows)) + 2
-            config_width = max(len("CONFIG"), max(get_text_length(row[4]) for row in rows)) + 2
-            self.formatter.print_table(["NAME", "STATUS", "IMAGE", "UPDATE", "CONFIG"], rows, [name_width, status_width, image_width, update_width, config_width])
+            headers = ["NAME", "STATUS", "IMAGE", "UPDATE", "CONFIG"]
+            # Transposition lignes -> colonnes : une seule passe par colonne pour les largeurs
+            widths = [
+                max(len(header), max(map(get_text_length, column))) + 2
+                for header, column in zip(headers, zip(*rows))
+            ]
+            self.formatter.print_table(headers, rows, widths)
         else:
             print("  No nihil containers found.")
         return 0
@@ -1481,7 +1568,20 @@ class NihilController:
     def _cmd_completion(self, args) -> int:
         import shutil
         import subprocess
+        from importlib.metadata import PackageNotFoundError, version
+        from nihil.config import CACHE_DIR
         shell = args.shell
+        # Le script dépend du shell, de nihil et d'argcomplete (qui le génère) : servi depuis le cache s'il existe
+        try:
+            argcomplete_version = version("argcomplete")
+        except PackageNotFoundError:
+            argcomplete_version = "none"
+        cache_path = CACHE_DIR / f"completion-{shell}-{__version__}-argcomplete-{argcomplete_version}.sh"
+        try:
+            sys.stdout.write(cache_path.read_text(encoding="utf-8"))
+            return 0
+        except OSError:
+            pass
         tool = shutil.which("register-python-argcomplete")
         if not tool:
             print(
@@ -1499,19 +1599,47 @@ class NihilController:
         cmd.append("nihil")
         try:
             result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            print(result.stdout, end="")
-            return 0
         except subprocess.CalledProcessError as e:
             print(self.formatter.error(f"Échec de la génération du script de complétion pour {shell} : {e}"), file=sys.stderr)
             return 1
+        try:
+            # Écriture atomique : un autre shell peut lire le cache au même moment
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(result.stdout, encoding="utf-8")
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass
+        sys.stdout.write(result.stdout)
+        return 0
+
+
+_CONTROLLER: Optional[NihilController] = None
+
+
+def get_controller() -> NihilController:
+    """Controller partagé du process : les parsers déjà construits sont réutilisés d'un run() à l'autre."""
+    global _CONTROLLER
+    if _CONTROLLER is None:
+        _CONTROLLER = NihilController()
+    return _CONTROLLER
 
 
 def main() -> int:
     argv: List[str] = sys.argv[1:]
+    if argv == ["--version"]:
+        # Réponse directe : ni filesystem, ni config, ni parser (même sortie que l'action argparse)
+        print(f"nihil {__version__}")
+        return 0
     exit_code: int
     try:
-        controller = NihilController()
-        exit_code = controller.run(argv)
+        if argv == ["version"]:
+            # Même sortie que _cmd_version, sans filesystem/config/parser ; reste journalisé
+            print(f"Nihil version {__version__}")
+            exit_code = 0
+        else:
+            controller = NihilController()
+            exit_code = controller.run(argv)
     except KeyboardInterrupt:
         formatter = NihilFormatter()
         print(f"\n\n{formatter.warning('User interruption.')}")
@@ -3,6 +3,8 @@
 """Parser CLI Nihil: sous-commandes et arguments."""
 
 import argparse
+import os
+from typing import List, Optional
 
 from nihil import __version__
 
@@ -12,44 +14,24 @@ except Exception:
     argcomplete = None
 
 
-def create_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="nihil",
-        description="Nihil - by 0xbbuddha and Goultarde",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  nihil --version                      Display version
-  nihil --help                         Display this help
-  nihil info                           Show images and containers
-  nihil start pentest --privileged     Start a privileged container
-  nihil exec pentest                   Connect to a container
-  nihil remove test1 test2 --force     Remove multiple containers
-  nihil uninstall                      Remove default image
-  nihil update                         Update all installed images
-  nihil update ad                      Update the ad image only
-  nihil upgrade                        Upgrade all nihil containers (interactive)
-  nihil upgrade pentest                Upgrade a specific container
-  nihil upgrade pentest blueteam        Upgrade multiple containers
-  nihil resources install              Clone the shared nihil-resources catalog
-  nihil resources update               git pull the local nihil-resources catalog
-  nihil resources sync                 Fetch tools listed in catalog/resources.toml
-  nihil resources status               Show local nihil-resources status
-
-        """
-    )
-    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-    subparsers = parser.add_subparsers(dest="command", help="Available commands", metavar="COMMAND")
-
+def _build_info(subparsers) -> None:
     info_parser = subparsers.add_parser("info", help="Display information about images and containers")
     info_parser.add_argument("--container", "-c", metavar="NAME", help="Show detailed information for a specific container")
 
+
+def _build_images(subparsers) -> None:
     subparsers.add_parser("images", help="List available image variants")
 
+
+def _build_version(subparsers) -> None:
     subparsers.add_parser("version", help="Display Nihil version")
 
+
+def _build_doctor(subparsers) -> None:
     subparsers.add_parser("doctor", help="Run diagnostics checks (Docker, image, environment)")
 
+
+def _build_start(subparsers) -> None:
     start_parser = subparsers.add_parser("start", help="Start a container (creates it if it doesn't exist)")
     start_parser.add_argument("name", help="Container name")
     start_parser.add_argument("--privileged", action="store_true", help="Privileged mode")
@@ -67,40 +49,62 @@ Examples:
     start_parser.add_argument("--log", "-l", action="store_true", help="Enable shell logging (asciinema)")
     start_parser.add_argument("--no-shell", action="store_true", help="Don't open shell after starting")
 
+
+def _build_stop(subparsers) -> None:
     stop_parser = subparsers.add_parser("stop", help="Stop one or more containers")
     stop_parser.add_argument("names", nargs="+", help="Container name(s)")
 
+
+def _build_remove(subparsers) -> None:
     remove_parser = subparsers.add_parser("remove", help="Remove one or more containers")
     remove_parser.add_argument("names", nargs="*", help="Container name(s)")
     remove_parser.add_argument("--force", "-f", action="store_true", help="Force removal")
 
+
+def _build_install(subparsers) -> None:
     install_parser = subparsers.add_parser("install", help="Install or update nihil images")
     install_parser.add_argument("image", nargs="?", default=None, metavar="VARIANT", help="Image variant to install (full|ad|web|blueteam). If not specified, prompted to select.")
 
+
+def _build_uninstall(subparsers) -> None:
     uninstall_parser = subparsers.add_parser("uninstall", help="Remove nihil images")
     uninstall_parser.add_argument("names", nargs="*", help="Image name(s)")
     uninstall_parser.add_argument("--force", "-f", action="store_true", help="Force removal")
 
+
+def _build_update(subparsers) -> None:
     update_parser = subparsers.add_parser("update", help="Update installed nihil images")
     update_parser.add_argument("image", choices=["full", "ad", "web", "blueteam"], nargs="?", default=None, help="Image variant to update. If not specified, all installed images are updated.")
 
+
+def _build_upgrade(subparsers) -> None:
     upgrade_parser = subparsers.add_parser("upgrade", help="Recreate one or more containers from the current local image (use --pull to also fetch the latest from the registry)")
     upgrade_parser.add_argument("names", nargs="*", help="Container name(s) to upgrade. If not specified, prompted to select.")
     upgrade_parser.add_argument("--force", "-f", action="store_true", help="Force upgrade/recreation even if image is already up to date")
     upgrade_parser.add_argument("--pull", "-p", action="store_true", help="Pull the latest image from the registry before recreating (default: use the existing local image)")
     upgrade_parser.add_argument("--image", "-i", choices=["full", "ad", "web", "blueteam"], default=None, help="Change the container's image variant to the specified one during the upgrade.")
 
+
+def _build_exec(subparsers) -> None:
     exec_parser = subparsers.add_parser("exec", help="Execute a command in a container")
     exec_parser.add_argument("name", help="Container name")
-    exec_parser.add_argument("command", nargs="*", help="Command to execute (default: zsh)")
+    # dest distinct de "command" (nom de la sous-commande) ; REMAINDER : les options de la commande passent sans guillemets
+    exec_parser.add_argument("exec_command", metavar="command", nargs=argparse.REMAINDER,
+                             help="Command to execute (default: zsh), e.g. nihil exec pentest nmap -sV host")
+
 
+def _build_tools(subparsers) -> None:
     tools_parser = subparsers.add_parser("tools", help="List tools available in a nihil image")
     tools_parser.add_argument("image", choices=["full", "ad", "active-directory", "web", "blueteam"], nargs="?", default=None, help="Image variant (default: full)")
     tools_parser.add_argument("--category", "-c", default=None, help="Filter by category (e.g. redteam_ad, redteam_web)")
 
+
+def _build_config(subparsers) -> None:
     config_parser = subparsers.add_parser("config", help="Show or edit the Nihil configuration file")
     config_parser.add_argument("--edit", "-e", action="store_true", help="Open the config file in $EDITOR")
 
+
+def _build_build(subparsers) -> None:
     build_parser = subparsers.add_parser("build", help="Build a nihil image locally from source")
     build_parser.add_argument("variant", choices=["full", "ad", "blueteam", "web", "test"], nargs="?", default="full", help="Image variant to build (default: full)")
     build_parser.add_argument("--source", "-s", metavar="PATH", default=None, help="Path to nihil-images source directory (overrides config)")
@@ -108,19 +112,93 @@ Examples:
     build_parser.add_argument("--tag", "-t", metavar="TAG", default=None, help="Custom image tag (default: nihil/<variant>:local)")
     build_parser.add_argument("--log", "-l", metavar="FILE", default=None, help="Write build output to a log file (use 'tail -f FILE' to follow)")
 
+
+def _build_resources(subparsers) -> None:
     resources_parser = subparsers.add_parser("resources", help="Manage the shared nihil-resources catalog")
     resources_subparsers = resources_parser.add_subparsers(dest="resources_action", metavar="ACTION")
     resources_install = resources_subparsers.add_parser("install", help="Clone the nihil-resources repository locally")
     resources_install.add_argument("--path", "-p", default=None, metavar="PATH", help="Destination path (default: from config, fallback: ~/.nihil/nihil-resources)")
     resources_install.add_argument("--force", "-f", action="store_true", help="Re-clone even if the destination already exists (after confirmation)")
-    resources_update = resources_subparsers.add_parser("update", help="git pull the local nihil-resources repository")
+    resources_subparsers.add_parser("update", help="git pull the local nihil-resources repository")
     resources_sync = resources_subparsers.add_parser("sync", help="Run the nihil-resources scripts/sync.py to fetch enabled tools")
     resources_sync.add_argument("--profile", default=None, help="Restrict sync to a profile (full|ad|web|blueteam)")
     resources_subparsers.add_parser("status", help="Show local nihil-resources status (path, branch, last commit)")
 
+
+def _build_completion(subparsers) -> None:
     completion_parser = subparsers.add_parser("completion", help="Generate shell completion script")
     completion_parser.add_argument("shell", choices=["bash", "zsh"], help="Target shell for completion script (bash or zsh)")
 
+
+_SUBCOMMAND_BUILDERS = {
+    "info": _build_info,
+    "images": _build_images,
+    "version": _build_version,
+    "doctor": _build_doctor,
+    "start": _build_start,
+    "stop": _build_stop,
+    "remove": _build_remove,
+    "install": _build_install,
+    "uninstall": _build_uninstall,
+    "update": _build_update,
+    "upgrade": _build_upgrade,
+    "exec": _build_exec,
+    "tools": _build_tools,
+    "config": _build_config,
+    "build": _build_build,
+    "resources": _build_resources,
+    "completion": _build_completion,
+}
+
+
+def sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Retourne la sous-commande visée par argv si elle est connue, None sinon."""
+    # argcomplete a besoin de l'arbre complet pour proposer les sous-commandes
+    if not argv or "_ARGCOMPLETE" in os.environ:
+        return None
+    first = argv[0]
+    return first if first in _SUBCOMMAND_BUILDERS else None
+
+
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Construit le parser CLI.
+
+    Si `argv` vise une sous-commande connue, seul son sous-parser est construit ;
+    sinon (aide, version, commande inconnue) toutes les sous-commandes le sont.
+    """
+    only = sniff_subcommand(argv) if argv is not None else None
+    parser = argparse.ArgumentParser(
+        prog="nihil",
+        description="Nihil - by 0xbbuddha and Goultarde",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  nihil --version                      Display version
+  nihil --help                         Display this help
+  nihil info                           Show images and containers
+  nihil start pentest --privileged     Start a privileged container
+  nihil exec pentest                   Connect to a container
+  nihil exec pentest ls -la /tmp       Run a command in a container
+  nihil remove test1 test2 --force     Remove multiple containers
+  nihil uninstall                      Remove default image
+  nihil update                         Update all installed images
+  nihil update ad                      Update the ad image only
+  nihil upgrade                        Upgrade all nihil containers (interactive)
+  nihil upgrade pentest                Upgrade a specific container
+  nihil upgrade pentest blueteam        Upgrade multiple containers
+  nihil resources install              Clone the shared nihil-resources catalog
+  nihil resources update               git pull the local nihil-resources catalog
+  nihil resources sync                 Fetch tools listed in catalog/resources.toml
+  nihil resources status               Show local nihil-resources status
+
+        """
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands", metavar="COMMAND")
+    for name, build in _SUBCOMMAND_BUILDERS.items():
+        if only is None or name == only:
+            build(subparsers)
+
     if argcomplete is not None:
         try:
             argcomplete.autocomplete(parser)
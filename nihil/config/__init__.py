@@ -2,6 +2,7 @@
 from nihil.config.defaults import (
     NIHIL_HOME,
     BROWSER_UI_PASSWORDS_FILE,
+    CACHE_DIR,
     MY_RESOURCES_DIR,
     NIHIL_RESOURCES_DIR,
     NIHIL_RESOURCES_REPO,
@@ -12,6 +13,7 @@ from nihil.config.user_config import NihilConfig, CONFIG_FILE
 __all__ = [
     "NIHIL_HOME",
     "BROWSER_UI_PASSWORDS_FILE",
+    "CACHE_DIR",
     "MY_RESOURCES_DIR",
     "NIHIL_RESOURCES_DIR",
     "NIHIL_RESOURCES_REPO",
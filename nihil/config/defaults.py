@@ -13,6 +13,9 @@ BROWSER_UI_PASSWORDS_FILE = NIHIL_HOME / "browser_ui_passwords.json"
 # Répertoire my-resources monté dans les containers
 MY_RESOURCES_DIR = NIHIL_HOME / "my-resources"
 
+# Fichiers régénérables (ex. scripts de complétion)
+CACHE_DIR = NIHIL_HOME / "cache"
+
 # Répertoire et dépôt git du catalogue partagé nihil-resources
 NIHIL_RESOURCES_DIR = NIHIL_HOME / "nihil-resources"
 NIHIL_RESOURCES_REPO = "https://github.com/TheNullPigeons/nihil-resources.git"
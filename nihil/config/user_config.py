@@ -7,8 +7,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from nihil.config.defaults import NIHIL_HOME
 
 CONFIG_FILE = NIHIL_HOME / "config.yml"
@@ -82,6 +80,8 @@ class NihilConfig:
         if not CONFIG_FILE.exists():
             self._write_defaults()
             return _deep_copy(_DEFAULT_CONFIG)
+        # Import différé : PyYAML coûte plus que le reste de la CLI au démarrage
+        import yaml
         try:
             with CONFIG_FILE.open("r", encoding="utf-8") as fh:
                 data = yaml.safe_load(fh) or {}
@@ -90,6 +90,7 @@ class NihilConfig:
         return _deep_merge(_DEFAULT_CONFIG, data)
 
     def _write_defaults(self) -> None:
+        import yaml
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
         with CONFIG_FILE.open("w", encoding="utf-8") as fh:
             fh.write(_CONFIG_COMMENT)
@@ -97,6 +98,7 @@ class NihilConfig:
 
     def save(self) -> None:
         """Persiste la configuration courante sur disque."""
+        import yaml
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
         with CONFIG_FILE.open("w", encoding="utf-8") as fh:
             fh.write(_CONFIG_COMMENT)
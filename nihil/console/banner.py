@@ -6,8 +6,7 @@ import sys
 from typing import Optional
 
 
-def get_banner() -> str:
-    banner = """
+_BANNER = """
     ╔═══════════════════════════════════════════════╗
     ║     ███╗   ██╗██╗██╗  ██╗██╗██╗     ██╗       ║
     ║     ████╗  ██║██║██║  ██║██║██║     ██║       ║
@@ -20,17 +19,20 @@ def get_banner() -> str:
     ║                 TheNullPigeons                ║
     ╚═══════════════════════════════════════════════╝
     """
-    return banner
+
+_COMPACT_BANNER = "  NIHIL  ·  TheNullPigeons\n  by 0xbbuddha and Goultarde"
+
+
+def get_banner() -> str:
+    return _BANNER
 
 
 def print_banner(file: Optional[object] = None) -> None:
-    if file is None:
-        file = sys.stdout
-    print(get_banner(), file=file, end='')
+    (file or sys.stdout).write(_BANNER)
 
 
 def get_compact_banner() -> str:
-    return "  NIHIL  ·  TheNullPigeons\n  by 0xbbuddha and Goultarde"
+    return _COMPACT_BANNER
 
 
 def print_compact_banner(file: Optional[object] = None) -> None:
@@ -45,4 +47,4 @@ def print_compact_banner(file: Optional[object] = None) -> None:
             highlight=False,
         )
     except ImportError:
-        print(get_compact_banner(), file=file)
+        file.write(_COMPACT_BANNER + "\n")
@@ -2,6 +2,16 @@
 # -*- coding: utf-8 -*-
 """Formatter Nihil: formatage de la sortie CLI."""
 
+import re
+
+# Préfixes des messages de statut
+_PFX_OK = "[✓] "
+_PFX_ERR = "[✗] "
+_PFX_INFO = "[*] "
+_PFX_WARN = "[!] "
+
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 
 class NihilFormatter:
     """Formats output for Nihil commands"""
@@ -17,6 +27,15 @@ class NihilFormatter:
 
     def __init__(self, use_colors: bool = True):
         self.use_colors = use_colors
+        # (préfixe, suffixe) déjà colorés des messages de statut
+        if use_colors:
+            green, red, blue, yellow, reset = self.GREEN, self.RED, self.BLUE, self.YELLOW, self.RESET
+        else:
+            green = red = blue = yellow = reset = ""
+        self._ok = (green + _PFX_OK, reset)
+        self._err = (red + _PFX_ERR, reset)
+        self._info = (blue + _PFX_INFO, reset)
+        self._warn = (yellow + _PFX_WARN, reset)
         try:
             from rich.console import Console
             self.console = Console()
@@ -29,24 +48,26 @@ class NihilFormatter:
         return text
 
     def _strip_ansi(self, text: str) -> str:
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return _ANSI_ESCAPE.sub('', text)
 
     def _real_len(self, text: str) -> int:
         return len(self._strip_ansi(text))
 
     def success(self, message: str) -> str:
-        return self._colorize(f"[✓] {message}", self.GREEN)
+        prefix, suffix = self._ok
+        return prefix + message + suffix
 
     def error(self, message: str) -> str:
-        return self._colorize(f"[✗] {message}", self.RED)
+        prefix, suffix = self._err
+        return prefix + message + suffix
 
     def info(self, message: str) -> str:
-        return self._colorize(f"[*] {message}", self.BLUE)
+        prefix, suffix = self._info
+        return prefix + message + suffix
 
     def warning(self, message: str) -> str:
-        return self._colorize(f"[!] {message}", self.YELLOW)
+        prefix, suffix = self._warn
+        return prefix + message + suffix
 
     def section_header(self, title: str, icon: str = "") -> str:
         header = f"{icon} {title}" if icon else title
@@ -95,19 +116,22 @@ class NihilFormatter:
             tl, tr, bl, br = "┌", "┐", "└", "┘"
             tm, bm, lm, rm = "┬", "┴", "├", "┤"
             c = "┼"
-            def print_sep(left, mid, right, char):
-                line_parts = [char * w for w in widths]
-                print(self._colorize(left + mid.join(line_parts) + right, self.CYAN))
-            print_sep(tl, tm, tr, h)
-            header_row = self._colorize(v, self.CYAN)
+            # Lignes accumulées puis écrites en un seul print
+            out = []
+            vbar = self._colorize(v, self.CYAN)
+            h_runs = [h * w for w in widths]
+            def sep(left, mid, right):
+                return self._colorize(left + mid.join(h_runs) + right, self.CYAN)
+            out.append(sep(tl, tm, tr))
+            header_row = [vbar]
             for i, col in enumerate(columns):
                 max_w = widths[i] - 2
                 col_text = str(col).ljust(max_w)
-                header_row += f" {self._colorize(col_text, self.BOLD)} {self._colorize(v, self.CYAN)}"
-            print(header_row)
-            print_sep(lm, c, rm, h)
+                header_row.append(f" {self._colorize(col_text, self.BOLD)} {vbar}")
+            out.append("".join(header_row))
+            out.append(sep(lm, c, rm))
             for row in rows:
-                line = self._colorize(v, self.CYAN)
+                line = [vbar]
                 for i, cell in enumerate(row):
                     if i >= len(widths):
                         break
@@ -118,9 +142,10 @@ class NihilFormatter:
                         color = cell[1]
                     max_w = widths[i] - 2
                     text_formatted = text.ljust(max_w)
-                    line += f" {self._colorize(text_formatted, color) if color else text_formatted} {self._colorize(v, self.CYAN)}"
-                print(line)
-            print_sep(bl, bm, br, h)
+                    line.append(f" {self._colorize(text_formatted, color) if color else text_formatted} {vbar}")
+                out.append("".join(line))
+            out.append(sep(bl, bm, br))
+            print("\n".join(out))
 
     def print_docs_hint(self) -> None:
         if self.console:
@@ -6,8 +6,6 @@ import json
 import sys
 from pathlib import Path
 from typing import Optional
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
 
 from nihil.config import BROWSER_UI_PASSWORDS_FILE
 
@@ -73,6 +71,9 @@ def get_session_str_for_recap(container, container_name: str) -> Optional[str]:
 
 def is_page_ready(port: int) -> bool:
     """True si la page de connexion Browser UI est servie (HTTP 200 + contenu 'Nihil')."""
+    # Import différé : urllib.request tire http.client, ssl, email... inutiles hors browser UI
+    from urllib.request import Request, urlopen
+    from urllib.error import URLError, HTTPError
     try:
         req = Request(f"http://127.0.0.1:{port}/", headers={"User-Agent": "Nihil-Wrapper"})
         with urlopen(req, timeout=3) as resp:
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Gestion Docker : images et conteneurs Nihil."""
 
+import functools
 import io
 import os
 import random
@@ -10,7 +11,7 @@ import subprocess
 import sys
 import tarfile
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Union
 
 import docker
 
@@ -32,6 +33,25 @@ from nihil.exceptions import (
 )
 
 
+# Filtre "reference" côté daemon (motifs path.Match : '*' ne traverse pas '/').
+# docker-py inspecte chaque image listée : on ne lui fait lister que les dépôts nihil.
+# Même couverture que le filtre local ('thenullpigeons' n'importe où, miroirs et dépôts imbriqués
+# compris) : le composant qui le contient peut avoir jusqu'à 2 composants avant et après lui.
+_NIHIL_IMAGE_REFERENCES = [
+    f"{before}*thenullpigeons*{after}"
+    for before in ("", "*/", "*/*/")
+    for after in ("", "/*", "/*/*")
+] + ["nihil/*", "nihil/*/*"]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_docker_client() -> "docker.DockerClient":
+    """Client Docker partagé par le process : config, socket et négociation d'API une seule fois."""
+    client = docker.from_env()
+    client.ping()
+    return client
+
+
 class NihilManager:
     DEFAULT_IMAGE = DEFAULT_IMAGE
     AVAILABLE_IMAGES = AVAILABLE_IMAGES
@@ -43,9 +63,10 @@ class NihilManager:
     def __init__(self):
         ensure_filesystem()
         try:
-            self.client = docker.from_env()
-            self.client.ping()
+            self.client = _get_docker_client()
             self.formatter = NihilFormatter()
+            # image ID -> docker.Image (container.image refait un GET /images à chaque accès)
+            self._container_images: Dict[str, object] = {}
         except docker.errors.DockerException as e:
             raise DockerUnavailable(f"Impossible de se connecter à Docker: {e}")
 
@@ -108,6 +129,16 @@ class NihilManager:
             return None
         return self.get_image_display_version(image)
 
+    def container_image(self, container):
+        """Image d'un container, mémoïsée par ID d'image (immuable) pour la durée du manager."""
+        image_id = container.attrs.get("ImageID") or container.attrs.get("Image")
+        if not image_id:
+            return container.image
+        image = self._container_images.get(image_id)
+        if image is None:
+            image = self._container_images[image_id] = container.image
+        return image
+
     def is_container_image_current(self, container) -> Optional[bool]:
         """True si l'image du container est l'image :latest locale du variant.
 
@@ -115,16 +146,17 @@ class NihilManager:
         on ne peut pas déterminer (variant inconnu, image latest absente, etc.).
         """
         try:
-            container_image_id = container.image.id
+            image = self.container_image(container)
+            container_image_id = image.id
         except Exception:
             return None
         if not container_image_id:
             return None
         try:
-            tag_used = container.image.tags[0] if container.image.tags else container.attrs.get("Config", {}).get("Image", "")
+            tag_used = image.tags[0] if image.tags else container.attrs.get("Config", {}).get("Image", "")
         except Exception:
             tag_used = ""
-        labels = self.get_image_labels(container.image)
+        labels = self.get_image_labels(image)
         variant = self._variant_for_image_tag(tag_used, labels)
         if not variant:
             return None
@@ -236,6 +268,9 @@ class NihilManager:
             transient=False,
         ) as progress:
             for event in self.client.api.pull(image, stream=True, decode=True):
+                # Le daemon signale les échecs dans le flux (HTTP 200) : on s'arrête au premier
+                if "error" in event:
+                    raise ImagePullFailed(image=image, message=f"Failed to pull image '{image}': {event['error']}")
                 layer_id = event.get("id", "")
                 status = event.get("status", "")
                 detail = event.get("progressDetail") or {}
@@ -489,19 +524,22 @@ class NihilManager:
     def list_containers(self, all: bool = True) -> List:
         try:
             containers = self.client.containers.list(all=all)
+            known_images = set(self.AVAILABLE_IMAGES.values())
             nihil_containers = []
             for c in containers:
                 try:
-                    config_image = c.attrs.get('Config', {}).get('Image', '')
-                    known_images = set(self.AVAILABLE_IMAGES.values())
-                    created_from_nihil = "thenullpigeons" in config_image.lower() or "nihil" in config_image.lower()
+                    config_image = c.attrs.get('Config', {}).get('Image', '').lower()
+                    created_from_nihil = "thenullpigeons" in config_image or "nihil" in config_image
                     
                     has_nihil_tag = False
-                    try:
-                        has_nihil_tag = c.image.tags and any(tag in known_images or "thenullpigeons" in tag for tag in c.image.tags)
-                    except Exception:
-                        pass
-                        
+                    if not created_from_nihil:
+                        # Config.Image suffit le plus souvent : on évite alors le GET de l'image
+                        try:
+                            tags = self.container_image(c).tags
+                            has_nihil_tag = tags and any(tag in known_images or "thenullpigeons" in tag for tag in tags)
+                        except Exception:
+                            pass
+
                     if has_nihil_tag or created_from_nihil:
                         nihil_containers.append(c)
                 except Exception as e:
@@ -514,7 +552,7 @@ class NihilManager:
 
     def list_images(self) -> List:
         try:
-            images = self.client.images.list()
+            images = self.client.images.list(filters={"reference": _NIHIL_IMAGE_REFERENCES})
             known_images = set(self.AVAILABLE_IMAGES.values())
             nihil_images = []
             for img in images:
@@ -533,7 +571,7 @@ class NihilManager:
         """Retourne les builds locaux nihil/<variant>:local sous forme {variant: tag}."""
         local: Dict[str, str] = {}
         try:
-            for img in self.client.images.list():
+            for img in self.client.images.list(filters={"reference": "nihil/*:local"}):
                 for tag in (img.tags or []):
                     if tag.startswith("nihil/") and tag.endswith(":local"):
                         variant = tag[len("nihil/"):-len(":local")]
@@ -630,11 +668,11 @@ class NihilManager:
             print(f"Warning: could not copy file into container: {e}", file=sys.stderr)
             return False
 
-    def exec_in_container(self, container, command: str = "zsh"):
-        import subprocess
+    def exec_in_container(self, container, command: Union[str, List[str]] = "zsh"):
+        """docker exec -it interactif ; une liste est passée telle quelle (pas de re-découpage shlex)."""
         import shlex
         container_id = container.id
-        cmd_args = shlex.split(command)
+        cmd_args = shlex.split(command) if isinstance(command, str) else list(command)
         full_command = ["docker", "exec", "-it", container_id] + cmd_args
         subprocess.run(full_command)
 
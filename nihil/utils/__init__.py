@@ -1,6 +1,13 @@
 # Utilitaires : historique, doctor, platform
 from nihil.utils.history import log_command, HISTORY_PATH
-from nihil.utils.doctor import NihilDoctor, DoctorCheckResult
 from nihil.utils.platform_info import get_host_os, get_docker_engine, host_network_supported, HostOS, DockerEngine
 
 __all__ = ["log_command", "HISTORY_PATH", "NihilDoctor", "DoctorCheckResult", "get_host_os", "get_docker_engine", "host_network_supported", "HostOS", "DockerEngine"]
+
+
+def __getattr__(name):
+    # nihil.utils.doctor importe le SDK docker : chargé seulement à la première utilisation
+    if name in ("NihilDoctor", "DoctorCheckResult"):
+        from nihil.utils import doctor
+        return getattr(doctor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
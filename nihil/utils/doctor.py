@@ -8,6 +8,7 @@ import os
 import platform
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
@@ -123,7 +124,6 @@ class NihilDoctor:
         return results
 
     def _check_image(self, manager: NihilManager) -> List[DoctorCheckResult]:
-        out: List[DoctorCheckResult] = []
         unique_images: dict[str, str] = {}
         for label, image in manager.AVAILABLE_IMAGES.items():
             if image == manager.DEFAULT_IMAGE and "full" in manager.AVAILABLE_IMAGES:
@@ -131,12 +131,17 @@ class NihilDoctor:
             else:
                 display = f"Image '{label}' ({image})"
             unique_images[image] = display
-        for image, display_name in unique_images.items():
+
+        def inspect(item) -> DoctorCheckResult:
+            image, display_name = item
             try:
                 manager.client.images.get(image)
-                out.append(DoctorCheckResult(display_name, True, "Present locally"))
+                return DoctorCheckResult(display_name, True, "Present locally")
             except docker.errors.ImageNotFound:
-                out.append(DoctorCheckResult(display_name, False, "Not present locally. Run 'nihil install'"))
+                return DoctorCheckResult(display_name, False, "Not present locally. Run 'nihil install'")
             except docker.errors.DockerException as e:
-                out.append(DoctorCheckResult(display_name, False, str(e)))
-        return out
+                return DoctorCheckResult(display_name, False, str(e))
+
+        # Un inspect par image, en parallèle ; map conserve l'ordre d'affichage
+        with ThreadPoolExecutor(max_workers=min(8, len(unique_images) or 1)) as pool:
+            return list(pool.map(inspect, unique_images.items()))
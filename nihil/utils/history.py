@@ -4,20 +4,31 @@
 
 from __future__ import annotations
 
+import os
+import shlex
 from pathlib import Path
 from typing import List
 
 
 HISTORY_PATH = Path.home() / ".config" / "nihil" / "history.log"
 
+# Ajout atomique en une écriture, sans couche d'I/O bufferisée ; 0600 : l'historique peut contenir des secrets
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
 
 def log_command(argv: List[str], exit_code: int) -> None:
     """Ajoute une entrée lisible dans l'historique."""
     try:
-        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
-        command_str = "nihil " + " ".join(argv)
-        line = f"{command_str}\n"
-        with HISTORY_PATH.open("a", encoding="utf-8") as f:
-            f.write(line)
+        # Arguments quotés pour que l'entrée reste rejouable telle quelle
+        line = ("nihil " + shlex.join(argv) + "\n").encode("utf-8")
+        try:
+            fd = os.open(HISTORY_PATH, _OPEN_FLAGS, 0o600)
+        except FileNotFoundError:
+            HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(HISTORY_PATH, _OPEN_FLAGS, 0o600)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
     except Exception:
         return
@@ -42,3 +42,16 @@ def temp_history_path(tmp_path, monkeypatch):
     monkeypatch.setattr("nihil.utils.history.HISTORY_PATH", history_file)
     
     return history_file
+
+
+@pytest.fixture(autouse=True)
+def reset_docker_client():
+    """Le client Docker est mémoïsé par process : chaque test repart d'un cache vide."""
+    import sys
+    manager_module = sys.modules.get("nihil.manager.manager")
+    if manager_module is not None:
+        manager_module._get_docker_client.cache_clear()
+    yield
+    manager_module = sys.modules.get("nihil.manager.manager")
+    if manager_module is not None:
+        manager_module._get_docker_client.cache_clear()
@@ -78,7 +78,7 @@ class TestIsPageReady:
         resp = MagicMock()
         resp.status = 200
         resp.read.return_value = b"<title>Nihil</title>"
-        with patch("nihil.features.browser_ui.urlopen") as m:
+        with patch("urllib.request.urlopen") as m:
             m.return_value.__enter__.return_value = resp
             m.return_value.__exit__.return_value = None
             assert browser_ui.is_page_ready(6901) is True
@@ -87,7 +87,7 @@ class TestIsPageReady:
         resp = MagicMock()
         resp.status = 200
         resp.read.return_value = b"<title>Other</title>"
-        with patch("nihil.features.browser_ui.urlopen") as m:
+        with patch("urllib.request.urlopen") as m:
             m.return_value.__enter__.return_value = resp
             m.return_value.__exit__.return_value = None
             assert browser_ui.is_page_ready(6901) is False
@@ -95,13 +95,13 @@ class TestIsPageReady:
     def test_returns_false_on_404(self):
         resp = MagicMock()
         resp.status = 404
-        with patch("nihil.features.browser_ui.urlopen") as m:
+        with patch("urllib.request.urlopen") as m:
             m.return_value.__enter__.return_value = resp
             m.return_value.__exit__.return_value = None
             assert browser_ui.is_page_ready(6901) is False
 
     def test_returns_false_on_connection_error(self):
         from urllib.error import URLError
-        with patch("nihil.features.browser_ui.urlopen") as m:
+        with patch("urllib.request.urlopen") as m:
             m.side_effect = URLError("connection refused")
             assert browser_ui.is_page_ready(6999) is False
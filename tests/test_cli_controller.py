@@ -4,7 +4,7 @@
 
 import pytest
 from types import SimpleNamespace
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
 
 
 class TestMainEntryPoint:
@@ -23,6 +23,28 @@ class TestMainEntryPoint:
         with patch("sys.argv", ["nihil", "version"]):
             assert main() == 0
 
+    def test_main_version_flag_skips_controller(self, capsys):
+        """--version répond sans construire le controller."""
+        from nihil import __version__
+        from nihil.cli.controller import main
+        with patch("sys.argv", ["nihil", "--version"]), \
+                patch("nihil.cli.controller.NihilController") as controller_cls:
+            assert main() == 0
+        controller_cls.assert_not_called()
+        assert capsys.readouterr().out == f"nihil {__version__}\n"
+
+    def test_main_version_command_skips_controller(self, capsys):
+        """`nihil version` répond sans controller mais reste dans l'historique."""
+        from nihil import __version__
+        from nihil.cli.controller import main
+        with patch("sys.argv", ["nihil", "version"]), \
+                patch("nihil.cli.controller.NihilController") as controller_cls, \
+                patch("nihil.cli.controller.log_command") as log:
+            assert main() == 0
+        controller_cls.assert_not_called()
+        log.assert_called_once_with(["version"], 0)
+        assert capsys.readouterr().out == f"Nihil version {__version__}\n"
+
 
 class TestUninstallForce:
     """Tests pour `nihil uninstall <image> --force`."""
@@ -54,12 +76,12 @@ class TestUninstallForce:
         ad_container.attrs = {"Image": "sha256:ADID", "Config": {"Image": image_ref}}
 
         manager.client.containers.list.return_value = [parasite, ad_container]
-        manager.get_container.return_value = ad_container
 
         controller = self._make_controller(manager, mock_formatter)
         args = SimpleNamespace(names=["ad"], force=True)
 
-        with patch("builtins.input") as mock_input:
+        with patch("builtins.input") as mock_input, \
+                patch("nihil.cli.controller.browser_ui_clear_password") as clear_password:
             rc = controller._cmd_uninstall(args)
 
         assert rc == 0
@@ -68,5 +90,327 @@ class TestUninstallForce:
         # Le conteneur en cours est arrêté puis supprimé.
         manager.stop_container.assert_called_once_with(ad_container)
         manager.remove_container.assert_called_once_with(ad_container, force=True)
+        clear_password.assert_called_once_with("pentest")
         # L'image est ensuite supprimée avec force=True.
         manager.remove_image.assert_called_once_with(image_ref, force=True)
+        # Le conteneur vient du listing unique : pas de nouvelle requête par nom.
+        manager.client.containers.list.assert_called_once_with(all=True)
+        manager.get_container.assert_not_called()
+
+    def test_force_clears_passwords_outside_the_pool(self, mock_formatter):
+        """Mots de passe effacés depuis le thread principal, seulement pour les conteneurs supprimés."""
+        import threading
+        from nihil.exceptions import ContainerRemoveFailed
+        image_ref = "ghcr.io/thenullpigeons/ad:latest"
+        manager = MagicMock()
+        manager.AVAILABLE_IMAGES = {"ad": image_ref}
+        manager.client.images.get.return_value = MagicMock(id="sha256:ADID")
+        containers = []
+        for name in ("alpha", "beta", "broken"):
+            c = MagicMock(status="exited")
+            c.name = name
+            c.attrs = {"Image": "sha256:ADID", "Config": {"Image": image_ref}}
+            containers.append(c)
+        manager.client.containers.list.return_value = containers
+
+        def remove_container(container, force):
+            if container.name == "broken":
+                raise ContainerRemoveFailed(name=container.name, message="boom")
+
+        manager.remove_container.side_effect = remove_container
+        controller = self._make_controller(manager, mock_formatter)
+        threads = []
+
+        with patch("nihil.cli.controller.browser_ui_clear_password",
+                   side_effect=lambda name: threads.append(threading.current_thread())) as clear_password:
+            controller._cmd_uninstall(SimpleNamespace(names=["ad"], force=True))
+
+        assert sorted(c.args[0] for c in clear_password.call_args_list) == ["alpha", "beta"]
+        assert threads == [threading.main_thread()] * 2
+
+    def test_interactive_selection_reuses_listing_id(self, mock_formatter):
+        """L'image choisie au prompt garde l'id du listing : pas d'images.get."""
+        image = MagicMock(id="sha256:ADID", tags=["ghcr.io/thenullpigeons/ad:latest"])
+        image.attrs = {"Size": 1 << 30}
+        manager = MagicMock()
+        manager.list_images.return_value = [image]
+        manager.short_image_name.side_effect = lambda tag: tag
+        manager.client.containers.list.return_value = []
+        controller = self._make_controller(manager, mock_formatter)
+        args = SimpleNamespace(names=[], force=True)
+
+        with patch("rich.prompt.IntPrompt.ask", return_value=1):
+            rc = controller._cmd_uninstall(args)
+
+        assert rc == 0
+        manager.client.images.get.assert_not_called()
+        manager.remove_image.assert_called_once_with("ghcr.io/thenullpigeons/ad:latest", force=True)
+
+
+class TestRemoveInteractive:
+    """Tests pour `nihil remove` sans argument (sélection interactive)."""
+
+    def test_selected_container_reuses_listing(self, mock_formatter):
+        """Le conteneur choisi provient du listing déjà récupéré : pas de get_container."""
+        from nihil.cli.controller import NihilController
+        container = MagicMock()
+        container.name = "pentest"
+        container.status = "exited"
+        container.attrs = {"HostConfig": {"Privileged": False}}
+
+        manager = MagicMock()
+        manager.list_containers.return_value = [container]
+        manager.container_image.return_value = MagicMock(tags=["ghcr.io/thenullpigeons/ad:latest"])
+        controller = NihilController.__new__(NihilController)
+        controller.manager = manager
+        controller.formatter = mock_formatter
+
+        with patch("rich.prompt.Prompt.ask", return_value="pentest"), \
+                patch("nihil.cli.controller.browser_ui_clear_password"):
+            rc = controller._cmd_remove(SimpleNamespace(names=[], force=False))
+
+        assert rc == 0
+        manager.get_container.assert_not_called()
+        manager.stop_container.assert_not_called()
+        manager.remove_container.assert_called_once_with(container, force=False)
+
+    def test_rows_built_once_across_selections(self, mock_formatter):
+        """Sélection multiple : l'image de chaque conteneur n'est lue qu'une fois, via le mémo du manager."""
+        from nihil.cli.controller import NihilController
+        containers = []
+        for name in ("alpha", "beta"):
+            c = MagicMock()
+            c.name = name
+            c.status = "exited"
+            c.attrs = {"HostConfig": {}}
+            containers.append(c)
+        tag_reads = [PropertyMock(return_value=["nihil:latest"]) for _ in containers]
+        for c, tags in zip(containers, tag_reads):
+            type(c.image).tags = tags
+
+        manager = MagicMock()
+        manager.list_containers.return_value = containers
+        manager.container_image.side_effect = lambda c: c.image
+        controller = NihilController.__new__(NihilController)
+        controller.manager = manager
+        controller.formatter = mock_formatter
+
+        with patch("rich.prompt.Prompt.ask", side_effect=["alpha", "y", "beta"]), \
+                patch("nihil.cli.controller.browser_ui_clear_password"):
+            rc = controller._cmd_remove(SimpleNamespace(names=[], force=False))
+
+        assert rc == 0
+        # Deuxième tour : seul "beta" reste proposé, sans relire son image
+        assert mock_formatter.print_table.call_args_list[1].args[1] == [["beta", "Exited", "nihil:latest", "Standard"]]
+        assert [c.args[0] for c in manager.container_image.call_args_list] == containers
+        assert [tags.call_count for tags in tag_reads] == [1, 1]
+        assert manager.remove_container.call_count == 2
+
+
+class TestControllerReuse:
+    """Un même controller peut enchaîner plusieurs run()."""
+
+    def _make_controller(self):
+        from nihil.cli.controller import NihilController
+        with patch("nihil.cli.controller.ensure_filesystem"), patch("nihil.cli.controller.NihilConfig"):
+            return NihilController()
+
+    def test_run_twice_with_different_commands(self):
+        controller = self._make_controller()
+        version, stop = MagicMock(return_value=0), MagicMock(return_value=0)
+        controller._handlers = {"version": (version, False), "stop": (stop, False)}
+        with patch("nihil.cli.controller.print_compact_banner"):
+            assert controller.run(["version"]) == 0
+            assert controller.run(["stop", "pentest"]) == 0
+            assert controller.run(["version"]) == 0
+        assert version.call_count == 2
+        assert stop.call_args[0][0].names == ["pentest"]
+        # Un parser par sous-commande, réutilisé au run suivant
+        assert set(controller._parsers) == {"version", "stop"}
+
+    def test_run_resets_manager(self):
+        controller = self._make_controller()
+        controller.manager = MagicMock()
+        controller._handlers = {"version": (MagicMock(return_value=0), False)}
+        controller.run(["version"])
+        assert controller.manager is None
+
+    def test_get_controller_is_cached(self):
+        from nihil.cli import controller as controller_module
+        with patch.object(controller_module, "_CONTROLLER", None), \
+                patch("nihil.cli.controller.ensure_filesystem"), patch("nihil.cli.controller.NihilConfig"):
+            first = controller_module.get_controller()
+            assert controller_module.get_controller() is first
+
+
+class TestRemoveParallel:
+    """Tests pour `nihil remove a b ...` (suppressions en parallèle)."""
+
+    def test_failure_does_not_block_other_containers(self, mock_formatter):
+        from nihil.cli.controller import NihilController
+        from nihil.exceptions import ContainerStopFailed
+        broken, healthy = MagicMock(status="running"), MagicMock(status="exited")
+        manager = MagicMock()
+        manager.get_container.side_effect = lambda name: {"broken": broken, "healthy": healthy}.get(name)
+        manager.stop_container.side_effect = ContainerStopFailed(name="broken", message="boom")
+        controller = NihilController.__new__(NihilController)
+        controller.manager = manager
+        controller.formatter = mock_formatter
+
+        with patch("nihil.cli.controller.browser_ui_clear_password") as clear_password:
+            rc = controller._cmd_remove(SimpleNamespace(names=["broken", "healthy", "missing"], force=False))
+
+        assert rc == 1
+        manager.remove_container.assert_called_once_with(healthy, force=False)
+        clear_password.assert_called_once_with("healthy")
+
+    def test_passwords_cleared_outside_the_pool(self, mock_formatter):
+        """Le fichier des mots de passe n'est pas verrouillé : effacement depuis le thread principal."""
+        import threading
+        from nihil.cli.controller import NihilController
+        containers = {name: MagicMock(status="exited") for name in ("a", "b", "c")}
+        manager = MagicMock()
+        manager.get_container.side_effect = containers.get
+        controller = NihilController.__new__(NihilController)
+        controller.manager = manager
+        controller.formatter = mock_formatter
+        threads = []
+
+        with patch("nihil.cli.controller.browser_ui_clear_password",
+                   side_effect=lambda name: threads.append(threading.current_thread())) as clear_password:
+            rc = controller._cmd_remove(SimpleNamespace(names=["a", "b", "c"], force=False))
+
+        assert rc == 0
+        assert sorted(c.args[0] for c in clear_password.call_args_list) == ["a", "b", "c"]
+        assert threads == [threading.main_thread()] * 3
+
+    def test_passwords_cleared_when_pool_raises(self, mock_formatter):
+        """Une erreur hors NihilError (timeout Docker) n'empêche pas d'effacer les mots de passe déjà supprimés."""
+        from nihil.cli.controller import NihilController
+        removed_a = MagicMock(status="exited")
+        stuck_b = MagicMock(status="running")
+        manager = MagicMock()
+        manager.get_container.side_effect = {"a": removed_a, "b": stuck_b}.get
+        manager.stop_container.side_effect = TimeoutError("read timed out")
+        controller = NihilController.__new__(NihilController)
+        controller.manager = manager
+        controller.formatter = mock_formatter
+
+        with patch("nihil.cli.controller.browser_ui_clear_password") as clear_password:
+            with pytest.raises(TimeoutError):
+                controller._cmd_remove(SimpleNamespace(names=["a", "b"], force=False))
+
+        manager.remove_container.assert_called_once_with(removed_a, force=False)
+        clear_password.assert_called_once_with("a")
+
+
+class TestCompletionCache:
+    """Tests pour le cache du script de complétion."""
+
+    def _make_controller(self, mock_formatter):
+        from nihil.cli.controller import NihilController
+        controller = NihilController.__new__(NihilController)
+        controller.formatter = mock_formatter
+        return controller
+
+    @staticmethod
+    def _cache_name(shell, argcomplete_version="3.0.0"):
+        from nihil import __version__
+        return f"completion-{shell}-{__version__}-argcomplete-{argcomplete_version}.sh"
+
+    def test_cached_script_skips_generator(self, tmp_path, capsys, mock_formatter):
+        (tmp_path / self._cache_name("zsh")).write_text("#compdef nihil\n")
+        with patch("nihil.config.CACHE_DIR", tmp_path), \
+                patch("importlib.metadata.version", return_value="3.0.0"), \
+                patch("subprocess.run") as run:
+            rc = self._make_controller(mock_formatter)._cmd_completion(SimpleNamespace(shell="zsh"))
+        assert rc == 0
+        run.assert_not_called()
+        assert capsys.readouterr().out == "#compdef nihil\n"
+
+    def test_generated_script_is_cached(self, tmp_path, capsys, mock_formatter):
+        generated = MagicMock(stdout="complete -F _nihil nihil\n")
+        with patch("nihil.config.CACHE_DIR", tmp_path), \
+                patch("importlib.metadata.version", return_value="3.0.0"), \
+                patch("shutil.which", return_value="/usr/bin/register-python-argcomplete"), \
+                patch("subprocess.run", return_value=generated) as run:
+            rc = self._make_controller(mock_formatter)._cmd_completion(SimpleNamespace(shell="bash"))
+        assert rc == 0
+        assert run.call_args[0][0] == ["/usr/bin/register-python-argcomplete", "nihil"]
+        assert capsys.readouterr().out == "complete -F _nihil nihil\n"
+        assert (tmp_path / self._cache_name("bash")).read_text() == "complete -F _nihil nihil\n"
+
+    def test_argcomplete_upgrade_invalidates_cache(self, tmp_path, capsys, mock_formatter):
+        """Un script généré par une autre version d'argcomplete n'est pas resservi."""
+        (tmp_path / self._cache_name("bash", "2.0.0")).write_text("stale\n")
+        generated = MagicMock(stdout="complete -F _nihil nihil\n")
+        with patch("nihil.config.CACHE_DIR", tmp_path), \
+                patch("importlib.metadata.version", return_value="3.0.0"), \
+                patch("shutil.which", return_value="/usr/bin/register-python-argcomplete"), \
+                patch("subprocess.run", return_value=generated) as run:
+            rc = self._make_controller(mock_formatter)._cmd_completion(SimpleNamespace(shell="bash"))
+        assert rc == 0
+        run.assert_called_once()
+        assert capsys.readouterr().out == "complete -F _nihil nihil\n"
+
+
+class TestBanner:
+    """La bannière n'est affichée que sur un terminal."""
+
+    def _run(self, isatty):
+        from nihil.cli.controller import NihilController
+        with patch("nihil.cli.controller.ensure_filesystem"), patch("nihil.cli.controller.NihilConfig"):
+            controller = NihilController()
+        controller._handlers = {"stop": (MagicMock(return_value=0), False)}
+        with patch("sys.stdout.isatty", return_value=isatty), \
+                patch("nihil.cli.controller.print_compact_banner") as banner:
+            controller.run(["stop", "pentest"])
+        return banner
+
+    def test_banner_on_tty(self):
+        self._run(isatty=True).assert_called_once()
+
+    def test_no_banner_when_piped(self):
+        self._run(isatty=False).assert_not_called()
+
+
+
+class TestExec:
+    """Tests pour `nihil exec <name> <command...>` (parsing réel jusqu'au docker exec)."""
+
+    def _run(self, argv):
+        from nihil.cli.controller import NihilController
+        with patch("nihil.cli.controller.ensure_filesystem"), patch("nihil.cli.controller.NihilConfig"):
+            controller = NihilController()
+        manager = MagicMock()
+        manager.get_container.return_value = MagicMock(status="running")
+        with patch("nihil.manager.NihilManager", return_value=manager), \
+                patch("sys.stdout.isatty", return_value=False):
+            rc = controller.run(argv)
+        assert rc == 0
+        return manager.exec_in_container.call_args.args[1]
+
+    def test_quoted_command_is_split(self):
+        """Ancien usage (et lignes d'historique) : une seule chaîne quotée."""
+        assert self._run(["exec", "pentest", "ls -la"]) == ["ls", "-la"]
+
+    def test_options_after_double_dash(self):
+        assert self._run(["exec", "pentest", "--", "ls", "-la"]) == ["ls", "-la"]
+
+    def test_options_without_quoting(self):
+        assert self._run(["exec", "pentest", "nmap", "-sV", "host"]) == ["nmap", "-sV", "host"]
+
+    def test_default_shell(self):
+        assert self._run(["exec", "pentest"]) == ["zsh"]
+
+class TestLazyConfig:
+    """config.yml n'est lu que par les commandes qui s'en servent."""
+
+    def test_config_loaded_on_first_access(self):
+        from nihil.cli.controller import NihilController
+        with patch("nihil.cli.controller.ensure_filesystem"), \
+                patch("nihil.cli.controller.NihilConfig") as config_cls:
+            controller = NihilController()
+            config_cls.assert_not_called()
+            assert controller.config is controller.config
+        config_cls.assert_called_once_with()
@@ -81,9 +81,16 @@ class TestCreateParser:
     def test_parse_exec(self):
         parser = create_parser()
         args = parser.parse_args(["exec", "c1", "bash"])
+        assert args.command == "exec"
         assert args.name == "c1"
-        # command (nargs="*") contient la commande à exécuter
-        assert args.command == ["bash"]
+        # exec_command (REMAINDER) contient la commande à exécuter
+        assert args.exec_command == ["bash"]
+
+    def test_parse_exec_command_with_options(self):
+        parser = create_parser()
+        args = parser.parse_args(["exec", "c1", "ls", "-la"])
+        assert args.command == "exec"
+        assert args.exec_command == ["ls", "-la"]
 
     def test_parse_install(self):
         parser = create_parser()
@@ -144,3 +151,30 @@ class TestCreateParser:
         args = parser.parse_args(["completion", "zsh"])
         assert args.command == "completion"
         assert args.shell == "zsh"
+
+
+class TestLazySubparsers:
+    """Construction ciblée du sous-parser demandé."""
+
+    def _choices(self, parser):
+        return set(parser._subparsers._group_actions[0].choices)
+
+    def test_sniff_known_subcommand(self):
+        from nihil.cli.parser import sniff_subcommand
+        assert sniff_subcommand(["stop", "a"]) == "stop"
+
+    def test_sniff_flag_or_unknown(self):
+        from nihil.cli.parser import sniff_subcommand
+        assert sniff_subcommand(["--help"]) is None
+        assert sniff_subcommand(["foo"]) is None
+        assert sniff_subcommand([]) is None
+
+    def test_only_requested_subparser_built(self):
+        parser = create_parser(["stop", "a"])
+        assert self._choices(parser) == {"stop"}
+        args = parser.parse_args(["stop", "a"])
+        assert args.names == ["a"]
+
+    def test_unknown_command_builds_all(self):
+        parser = create_parser(["foo"])
+        assert {"info", "start", "completion"} <= self._choices(parser)
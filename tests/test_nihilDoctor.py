@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests unitaires pour nihilDoctor.py"""
+
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+import docker.errors
+
+from nihil.exceptions import DockerUnavailable
+from nihil.utils.doctor import NihilDoctor
+
+
+@pytest.fixture
+def doctor(mock_formatter):
+    return NihilDoctor(formatter=mock_formatter)
+
+
+def _manager(images):
+    manager = MagicMock()
+    manager.AVAILABLE_IMAGES = images
+    manager.DEFAULT_IMAGE = images["full"]
+    return manager
+
+
+class TestNihilDoctor:
+    """Tests pour la classe NihilDoctor"""
+
+    def test_check_image_keeps_display_order(self, doctor):
+        """Les inspects tournent en parallèle mais les résultats gardent l'ordre des variants"""
+        manager = _manager({"full": "img/full", "ad": "img/ad", "web": "img/web"})
+        delays = {"img/full": 0.05, "img/ad": 0.02, "img/web": 0.0}
+        manager.client.images.get.side_effect = lambda image: time.sleep(delays[image])
+
+        results = doctor._check_image(manager)
+
+        assert [r.name for r in results] == [
+            "Image 'full' (img/full)",
+            "Image 'ad' (img/ad)",
+            "Image 'web' (img/web)",
+        ]
+        assert all(r.ok for r in results)
+
+    def test_check_image_reports_missing_image(self, doctor):
+        """Une image absente est signalée sans interrompre les autres checks"""
+        manager = _manager({"full": "img/full", "ad": "img/ad"})
+
+        def get(image):
+            if image == "img/ad":
+                raise docker.errors.ImageNotFound("absent")
+
+        manager.client.images.get.side_effect = get
+
+        results = doctor._check_image(manager)
+
+        assert [(r.ok, r.details) for r in results] == [
+            (True, "Present locally"),
+            (False, "Not present locally. Run 'nihil install'"),
+        ]
+
+    def test_run_daemon_unreachable_returns_exit_code(self, doctor):
+        """Daemon injoignable : check en échec et code de sortie de l'erreur"""
+        with patch("nihil.utils.doctor.NihilManager", side_effect=DockerUnavailable("socket refusé")), \
+                patch("rich.console.Console.print"):
+            rc = doctor.run()
+
+        assert rc == 2
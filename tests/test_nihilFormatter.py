@@ -99,3 +99,17 @@ class TestNihilFormatter:
         assert formatter_colors.RED in colored
         assert formatter_colors.RESET in colored
         assert plain == "text"
+
+    def test_print_table_fallback_single_write(self, capsys):
+        """Sans rich, le tableau est émis en un seul print."""
+        formatter = NihilFormatter(use_colors=False)
+        formatter.console = None
+
+        with patch("builtins.print", wraps=print) as mock_print:
+            formatter.print_table(["NAME", "STATUS"], [["pentest", ("Running", formatter.GREEN)]])
+
+        mock_print.assert_called_once()
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 5
+        assert lines[0].startswith("┌") and lines[-1].startswith("└")
+        assert "pentest" in lines[3] and "Running" in lines[3]
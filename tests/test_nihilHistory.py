@@ -58,6 +58,14 @@ class TestNihilHistory:
         assert len(lines) == 1
         assert lines[0] == "nihil start test-container --privileged"
     
+    def test_log_command_quotes_arguments_with_spaces(self, temp_history_path):
+        """Les arguments contenant des espaces sont quotés (entrée rejouable)"""
+        log_command(["exec", "pentest", "ls -la /tmp"], exit_code=0)
+
+        content = temp_history_path.read_text()
+
+        assert content == "nihil exec pentest 'ls -la /tmp'\n"
+
     def test_log_command_multiple_entries(self, temp_history_path):
         """Test plusieurs entrées dans le fichier"""
         log_command(["start", "container1"], exit_code=0)
@@ -71,3 +79,12 @@ class TestNihilHistory:
         assert "nihil start container1" in lines[0]
         assert "nihil stop container2" in lines[1]
         assert "nihil remove container3" in lines[2]
+
+    def test_log_command_creates_private_file(self, tmp_path, monkeypatch):
+        """Test le fichier créé n'est lisible que par l'utilisateur"""
+        history_file = tmp_path / "history.log"
+        monkeypatch.setattr("nihil.utils.history.HISTORY_PATH", history_file)
+
+        log_command(["start", "box", "--browser-ui-password", "secret"], exit_code=0)
+
+        assert history_file.stat().st_mode & 0o777 == 0o600
@@ -2,11 +2,14 @@
 # -*- coding: utf-8 -*-
 """Tests unitaires pour nihilManager.py"""
 
+import re
+
 import pytest
 from unittest.mock import MagicMock, Mock, patch, call
 import docker.errors
 
 from nihil.manager import NihilManager
+from nihil.manager.manager import _NIHIL_IMAGE_REFERENCES
 from nihil.config import ensure_filesystem
 from nihil.exceptions import (
     DockerUnavailable,
@@ -38,6 +41,16 @@ class TestNihilManager:
                 with pytest.raises(DockerUnavailable):
                     NihilManager()
     
+    def test_init_reuses_docker_client(self, mock_docker_client):
+        """Deux NihilManager du même process partagent le client Docker"""
+        with patch('nihil.manager.manager.docker.from_env', return_value=mock_docker_client) as from_env:
+            with patch('nihil.manager.manager.ensure_filesystem'):
+                first = NihilManager()
+                second = NihilManager()
+                assert first.client is second.client
+                from_env.assert_called_once()
+                mock_docker_client.ping.assert_called_once()
+
     def test_ensure_image_exists_image_found(self, mock_docker_client):
         """Test ensure_image_exists quand l'image existe déjà"""
         mock_image = MagicMock()
@@ -77,6 +90,21 @@ class TestNihilManager:
                         with pytest.raises(ImagePullFailed):
                             manager.ensure_image_exists("test-image:latest")
     
+    def test_pull_with_progress_raises_on_stream_error(self, mock_docker_client):
+        """Une erreur renvoyée dans le flux de pull interrompt le pull."""
+        mock_docker_client.images.get.side_effect = docker.errors.ImageNotFound("Not found")
+        mock_docker_client.api.pull.return_value = iter([
+            {"status": "Pulling from thenullpigeons/nihil"},
+            {"error": "manifest unknown"},
+            {"id": "abc", "status": "Downloading"},
+        ])
+
+        with patch('nihil.manager.manager.docker.from_env', return_value=mock_docker_client):
+            with patch('nihil.manager.manager.ensure_filesystem'):
+                manager = NihilManager()
+                with pytest.raises(ImagePullFailed, match="manifest unknown"):
+                    manager._pull_with_progress("test-image:latest")
+
     def test_create_container_config_defaults(self, mock_docker_client):
         """Test création de container avec valeurs par défaut"""
         mock_container = MagicMock()
@@ -196,6 +224,44 @@ class TestNihilManager:
                 assert len(containers) == 1
                 assert containers[0] == nihil_container
 
+    def test_list_images_filters_on_daemon_side(self, mock_docker_client):
+        """list_images demande au daemon les seuls dépôts nihil, puis garde le filtre local"""
+        nihil_image = MagicMock(tags=["ghcr.io/thenullpigeons/full:latest"])
+        untagged = MagicMock(tags=[])
+        mock_docker_client.images.list.return_value = [nihil_image, untagged]
+
+        with patch('nihil.manager.manager.docker.from_env', return_value=mock_docker_client):
+            with patch('nihil.manager.manager.ensure_filesystem'):
+                manager = NihilManager()
+                assert manager.list_images() == [nihil_image]
+
+        filters = mock_docker_client.images.list.call_args.kwargs["filters"]
+        assert filters["reference"] == _NIHIL_IMAGE_REFERENCES
+
+    @pytest.mark.parametrize("reference, expected", [
+        ("ghcr.io/thenullpigeons/full:latest", True),
+        ("thenullpigeons/full:latest", True),
+        ("registry.example.com/thenullpigeons/full:latest", True),
+        ("localhost:5000/thenullpigeons/ad", True),
+        ("ghcr.io/thenullpigeons/x/y:latest", True),
+        ("mirror.local/cache/thenullpigeons/web:latest", True),
+        ("nihil/full:v1.2.3", True),
+        ("nihil/full:local", True),
+        ("ubuntu:latest", False),
+        ("docker.io/library/nginx:1.25", False),
+    ])
+    def test_reference_filter_keeps_local_check_coverage(self, reference, expected):
+        """Les motifs daemon couvrent tout ce que le filtre local accepte (miroirs, dépôts imbriqués)"""
+        def path_match(pattern, name):
+            # Sémantique path.Match (Go) : '*' ne traverse pas '/'
+            regex = "".join("[^/]*" if ch == "*" else re.escape(ch) for ch in pattern)
+            return re.fullmatch(regex, name) is not None
+
+        # Le daemon teste la référence complète puis le nom sans tag
+        name = reference.rsplit(":", 1)[0] if ":" in reference.rsplit("/", 1)[-1] else reference
+        matched = any(path_match(p, reference) or path_match(p, name) for p in _NIHIL_IMAGE_REFERENCES)
+        assert matched is expected
+
     def test_get_image_version_reads_label(self, mock_docker_client):
         """get_image_version retourne la valeur du label org.nihil.version."""
         mock_image = MagicMock()
@@ -282,6 +348,35 @@ class TestNihilManager:
                 manager = NihilManager()
                 assert manager.is_container_image_current(container) is False
 
+    def test_exec_in_container_keeps_argv_list(self, mock_docker_client):
+        """Une commande en liste n'est pas re-découpée (arguments avec espaces conservés)."""
+        container = MagicMock(id="abc123")
+        with patch('nihil.manager.manager.docker.from_env', return_value=mock_docker_client):
+            with patch('nihil.manager.manager.ensure_filesystem'):
+                manager = NihilManager()
+                with patch('subprocess.run') as run:
+                    manager.exec_in_container(container, ["echo", "hello world"])
+                    manager.exec_in_container(container, "mkdir -p /workspace/logs")
+        assert run.call_args_list[0][0][0] == ["docker", "exec", "-it", "abc123", "echo", "hello world"]
+        assert run.call_args_list[1][0][0] == ["docker", "exec", "-it", "abc123", "mkdir", "-p", "/workspace/logs"]
+
+    def test_container_image_memoized_by_image_id(self, mock_docker_client):
+        """container_image ne refait pas le GET de l'image pour un ID déjà vu."""
+        from unittest.mock import PropertyMock
+        image = MagicMock(id="sha256:abc")
+        image_prop = PropertyMock(return_value=image)
+        first, second = MagicMock(), MagicMock()
+        type(first).image = image_prop
+        type(second).image = image_prop
+        first.attrs = second.attrs = {"Image": "sha256:abc"}
+
+        with patch('nihil.manager.manager.docker.from_env', return_value=mock_docker_client):
+            with patch('nihil.manager.manager.ensure_filesystem'):
+                manager = NihilManager()
+                assert manager.container_image(first) is image
+                assert manager.container_image(second) is image
+                assert image_prop.call_count == 1
+
     def test_display_version_stable_semver_unchanged(self, mock_docker_client):
         """Une version semver (v1.2.3) est affichée telle quelle, sans short_id."""
         mock_image = MagicMock()